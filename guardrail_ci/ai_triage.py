@@ -1,16 +1,68 @@
 from __future__ import annotations
 
+import atexit
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import requests
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 from guardrail_ci.config import AiSettings
 from guardrail_ci.models import Finding, sort_findings
 
+if TYPE_CHECKING:
+    import requests
+
 ALLOWED_SEVERITIES = {"critical", "high", "medium", "low", "info"}
+CONTEXT_WINDOW = 2
+
+
+def _json_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@lru_cache(maxsize=1)
+def _get_session(pool_size: int) -> requests.Session:
+    """Shared keep-alive session so repeated calls reuse TCP/TLS connections.
+
+    Built on first use so ``requests`` is only imported when triage actually
+    calls out; it dominates CLI start-up time otherwise. ``pool_size`` should
+    match the number of concurrent requests so no connection is discarded.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    atexit.register(session.close)
+    return session
 
 
 def _chat_url(base_url: str) -> str:
@@ -20,36 +72,82 @@ def _chat_url(base_url: str) -> str:
     return f"{base}/v1/chat/completions"
 
 
+def _find_first_json_object(text: str) -> str | None:
+    """Return the first balanced ``{...}`` span, skipping braces inside strings."""
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for idx in range(start, len(text)):
+        ch = text[idx]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:idx + 1]
+    return None
+
+
 def _extract_json(text: str) -> dict[str, Any]:
     text = text.strip()
     if not text:
         return {}
 
-    # Allow fenced JSON blocks
-    fenced = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.S)
-    if fenced:
-        text = fenced.group(1)
+    # Fast path: response_format=json_object normally yields bare JSON
+    try:
+        return _json_loads(text)
+    except Exception:
+        pass
 
+    # Allow fenced JSON blocks
+    fence = text.find("```")
+    if fence != -1:
+        end = text.find("```", fence + 3)
+        if end != -1:
+            text = text[fence + 3:end]
+
+    candidate = _find_first_json_object(text)
+    if candidate is None:
+        return {}
     try:
-        return json.loads(text)
+        return _json_loads(candidate)
     except Exception:
-        # fallback: greedy object extraction
-        m = re.search(r"\{.*\}", text, re.S)
-        if not m:
-            return {}
-        try:
-            return json.loads(m.group(0))
-        except Exception:
-            return {}
-
-
-def _context_window(path: Path, line: int | None, window: int = 2) -> str:
-    if line is None or not path.exists() or not path.is_file():
-        return ""
+        return {}
+
+
+def _read_head(path: Path, stop: int) -> list[str]:
+    """Return the first ``stop`` lines of ``path`` without reading past them.
+
+    Lines are split like ``str.splitlines()`` so numbering matches the detectors.
+    """
+    if not path.exists() or not path.is_file():
+        return []
+    lines: list[str] = []
     try:
-        lines = path.read_text(errors="ignore").splitlines()
+        with path.open(errors="ignore") as fh:
+            for raw in fh:
+                lines.extend(raw.splitlines())
+                if len(lines) >= stop:
+                    break
     except Exception:
-        return ""
+        return []
+    return lines[:stop]
+
+
+def _format_window(lines: list[str], line: int, window: int = CONTEXT_WINDOW) -> str:
     start = max(0, line - 1 - window)
     end = min(len(lines), line + window)
     snippet = []
@@ -59,24 +157,30 @@ def _context_window(path: Path, line: int | None, window: int = 2) -> str:
 
 
 def _build_payload(root: Path, findings: list[Finding], max_findings: int) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
-    for finding in findings[:max_findings]:
-        fpath = root / finding.file
-        out.append(
-            {
-                "id": finding.id,
-                "file": finding.file,
-                "line": finding.line,
-                "title": finding.title,
-                "category": finding.category,
-                "severity": finding.severity,
-                "message": finding.message,
-                "remediation": finding.remediation,
-                "evidence": finding.evidence,
-                "context": _context_window(fpath, finding.line),
-            }
-        )
-    return out
+    selected = findings[:max_findings]
+
+    # Read each file once, up to the last line any of its findings needs.
+    last_line: dict[str, int] = {}
+    for finding in selected:
+        if finding.line is not None:
+            last_line[finding.file] = max(last_line.get(finding.file, 0), finding.line)
+    file_lines = {file: _read_head(root / file, line + CONTEXT_WINDOW) for file, line in last_line.items()}
+
+    return [
+        {
+            "id": finding.id,
+            "file": finding.file,
+            "line": finding.line,
+            "title": finding.title,
+            "category": finding.category,
+            "severity": finding.severity,
+            "message": finding.message,
+            "remediation": finding.remediation,
+            "evidence": finding.evidence,
+            "context": _format_window(file_lines[finding.file], finding.line) if finding.line is not None else "",
+        }
+        for finding in selected
+    ]
 
 
 def _build_messages(repo_path: Path, payload: list[dict[str, Any]]) -> list[dict[str, str]]:
@@ -106,7 +210,7 @@ def _build_messages(repo_path: Path, payload: list[dict[str, Any]]) -> list[dict
     }
     return [
         {"role": "system", "content": system},
-        {"role": "user", "content": json.dumps(user)},
+        {"role": "user", "content": _json_bytes(user).decode("utf-8")},
     ]
 
 
@@ -119,6 +223,47 @@ def _normalize_sev(value: str | None) -> str | None:
     return None
 
 
+class _InvalidResponseShape(ValueError):
+    pass
+
+
+def _request_decisions(
+    session: requests.Session,
+    root: Path,
+    batch: list[dict[str, Any]],
+    settings: AiSettings,
+) -> list[Any]:
+    """POST one batch of findings and return the raw ``decisions`` list."""
+    req_body = {
+        "model": settings.model,
+        "messages": _build_messages(root, batch),
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"},
+    }
+    resp = session.post(
+        _chat_url(settings.base_url or ""),
+        headers={
+            "Authorization": f"Bearer {settings.api_key}",
+            "Content-Type": "application/json",
+        },
+        data=_json_bytes(req_body),
+        timeout=settings.timeout_seconds,
+    )
+    resp.raise_for_status()
+    data = resp.json()
+
+    content = (
+        data.get("choices", [{}])[0]
+        .get("message", {})
+        .get("content", "")
+    )
+    parsed = _extract_json(content)
+    decisions = parsed.get("decisions") if isinstance(parsed, dict) else None
+    if not isinstance(decisions, list):
+        raise _InvalidResponseShape("invalid_ai_response_shape")
+    return decisions
+
+
 def apply_ai_triage(root: Path, findings: list[Finding], settings: AiSettings) -> tuple[list[Finding], dict[str, Any]]:
     """Apply optional LLM triage to findings, returning updated findings + metadata."""
     if not settings.enabled:
@@ -134,89 +279,91 @@ def apply_ai_triage(root: Path, findings: list[Finding], settings: AiSettings) -
             "reason": "missing_openai_config",
         }
 
-    payload = _build_payload(root, findings, settings.max_findings)
-    req_body = {
-        "model": settings.model,
-        "messages": _build_messages(root, payload),
-        "temperature": 0.1,
-        "response_format": {"type": "json_object"},
-    }
-
-    try:
-        resp = requests.post(
-            _chat_url(settings.base_url),
-            headers={
-                "Authorization": f"Bearer {settings.api_key}",
-                "Content-Type": "application/json",
-            },
-            json=req_body,
-            timeout=settings.timeout_seconds,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        content = (
-            data.get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "")
-        )
-        parsed = _extract_json(content)
-        decisions = parsed.get("decisions") if isinstance(parsed, dict) else None
-        if not isinstance(decisions, list):
+    # Baseline-suppressed findings are already accepted; don't pay to triage them.
+    candidates = [f for f in findings if not f.suppressed]
+    if not candidates:
+        return findings, {"status": "skipped", "mode": settings.mode, "reason": "all_suppressed"}
+
+    payload = _build_payload(root, candidates, settings.max_findings)
+    if not payload:
+        return findings, {"status": "skipped", "mode": settings.mode, "reason": "no_findings_selected"}
+
+    batch_size = max(1, settings.batch_size)
+    batches = [payload[i:i + batch_size] for i in range(0, len(payload), batch_size)]
+
+    decisions: list[Any] = []
+    failed = 0
+    invalid_shape = 0
+    last_error = ""
+    concurrency = max(1, settings.concurrency)
+    session = _get_session(concurrency)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as pool:
+        futures = [pool.submit(_request_decisions, session, root, batch, settings) for batch in batches]
+        for future in futures:
+            try:
+                decisions.extend(future.result())
+            except _InvalidResponseShape:
+                failed += 1
+                invalid_shape += 1
+            except Exception as e:
+                failed += 1
+                last_error = str(e)[:220]
+
+    if failed == len(batches):
+        if invalid_shape == failed:
             return findings, {
                 "status": "fallback",
                 "mode": settings.mode,
                 "reason": "invalid_ai_response_shape",
             }
-
-        indexed = {(f.id, f.file, f.line): f for f in findings}
-        updated: dict[tuple[str, str, int | None], Finding] = {}
-        applied = 0
-
-        for item in decisions:
-            if not isinstance(item, dict):
-                continue
-            key = (item.get("id"), item.get("file"), item.get("line"))
-            if key not in indexed:
-                continue
-
-            base = indexed[key]
-            sev = _normalize_sev(str(item.get("severity", ""))) or base.severity
-            rationale = str(item.get("rationale") or "").strip()
-            remediation = str(item.get("remediation") or "").strip() or base.remediation
-            msg = base.message
-            if rationale:
-                msg = f"{base.message} AI triage: {rationale}"
-
-            updated[key] = Finding(
-                id=base.id,
-                title=base.title,
-                category=base.category,
-                severity=sev,
-                file=base.file,
-                line=base.line,
-                message=msg,
-                remediation=remediation,
-                evidence=base.evidence,
-            )
-            applied += 1
-
-        merged: list[Finding] = []
-        for finding in findings:
-            merged.append(updated.get((finding.id, finding.file, finding.line), finding))
-
-        return sort_findings(merged), {
-            "status": "ok",
-            "mode": settings.mode,
-            "model": settings.model,
-            "decisions_applied": applied,
-            "requested_findings": len(payload),
-        }
-
-    except Exception as e:
         return findings, {
             "status": "fallback",
             "mode": settings.mode,
             "reason": "ai_request_failed",
-            "error": str(e)[:220],
+            "error": last_error,
         }
+
+    indexed = {(f.id, f.file, f.line): f for f in candidates}
+    updated: dict[tuple[str, str, int | None], Finding] = {}
+    applied = 0
+
+    for item in decisions:
+        if not isinstance(item, dict):
+            continue
+        key = (item.get("id"), item.get("file"), item.get("line"))
+        if key not in indexed:
+            continue
+
+        base = indexed[key]
+        sev = _normalize_sev(str(item.get("severity", ""))) or base.severity
+        rationale = str(item.get("rationale") or "").strip()
+        remediation = str(item.get("remediation") or "").strip() or base.remediation
+        msg = base.message
+        if rationale:
+            msg = f"{base.message} AI triage: {rationale}"
+
+        updated[key] = base.with_updates(
+            severity=sev,
+            message=msg,
+            remediation=remediation,
+        )
+        applied += 1
+
+    merged: list[Finding] = []
+    for finding in findings:
+        merged.append(updated.get((finding.id, finding.file, finding.line), finding))
+
+    meta: dict[str, Any] = {
+        "status": "ok",
+        "mode": settings.mode,
+        "model": settings.model,
+        "decisions_applied": applied,
+        "requested_findings": len(payload),
+        "batches": len(batches),
+        "batches_failed": failed,
+    }
+    if failed:
+        meta["batches_invalid_shape"] = invalid_shape
+        if last_error:
+            meta["error"] = last_error
+    return sort_findings(merged), meta
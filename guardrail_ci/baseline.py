@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 import hashlib
-import re
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 from guardrail_ci.models import Finding
 
 
@@ -27,23 +33,35 @@ class SuppressionEntry:
 @dataclass(frozen=True)
 class Baseline:
     version: int
-    suppressions: list[SuppressionEntry]
+    suppressions: tuple[SuppressionEntry, ...]
+
+    def __post_init__(self) -> None:
+        # _index is cached, so the entries it covers must not change afterwards.
+        object.__setattr__(self, "suppressions", tuple(self.suppressions))
+
+    @cached_property
+    def _index(self) -> tuple[dict[str, SuppressionEntry], dict[str, list[SuppressionEntry]]]:
+        # Built once per Baseline; load_baseline hands out the same cached instance per file version.
+        return _index_suppressions(self.suppressions)
 
 
 def normalize_evidence(evidence: str) -> str:
-    return re.sub(r"\s+", " ", evidence.strip().lower())
+    return " ".join(evidence.lower().split())
+
+
+@lru_cache(maxsize=4096)
+def _fingerprint(finding_id: str, file: str, line: int, normalized_evidence: str) -> str:
+    raw = "|".join([finding_id, file, str(line), normalized_evidence])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
 def finding_fingerprint(finding: Finding) -> str:
-    raw = "|".join(
-        [
-            finding.id,
-            finding.file,
-            str(finding.line or 0),
-            normalize_evidence(finding.evidence),
-        ]
+    return _fingerprint(
+        finding.id,
+        finding.file,
+        finding.line or 0,
+        normalize_evidence(finding.evidence),
     )
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
 def _parse_date(value: str) -> date:
@@ -57,7 +75,12 @@ def load_baseline(path: Path) -> Baseline:
     if not path.exists():
         raise FileNotFoundError(f"Baseline file not found: {path}")
 
-    data = yaml.safe_load(path.read_text()) or {}
+    return _load_baseline_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_baseline_cached(path: str, mtime_ns: int) -> Baseline:
+    data = yaml.load(Path(path).read_bytes(), Loader=SafeLoader) or {}
     version = int(data.get("version", 1))
     raw_suppressions = data.get("suppressions") or []
     if not isinstance(raw_suppressions, list):
@@ -106,31 +129,45 @@ def load_baseline(path: Path) -> Baseline:
             )
         )
 
-    return Baseline(version=version, suppressions=suppressions)
-
+    # Immutable: load_baseline hands the same cached instance to every caller.
+    return Baseline(version=version, suppressions=tuple(suppressions))
 
-def match_suppression(
-    finding: Finding,
-    suppressions: list[SuppressionEntry],
-) -> SuppressionEntry | None:
-    fp = finding.fingerprint or finding_fingerprint(finding)
 
+def _index_suppressions(
+    suppressions: Iterable[SuppressionEntry],
+) -> tuple[dict[str, SuppressionEntry], dict[str, list[SuppressionEntry]]]:
+    by_fp: dict[str, SuppressionEntry] = {}
+    by_id: dict[str, list[SuppressionEntry]] = defaultdict(list)
     for s in suppressions:
-        if s.fingerprint and s.fingerprint == fp:
-            return s
+        if s.fingerprint:
+            by_fp.setdefault(s.fingerprint, s)
+        by_id[s.id].append(s)
+    return by_fp, by_id
 
-    for s in suppressions:
-        if s.id != finding.id:
-            continue
+
+def _match_by_location(
+    finding: Finding,
+    candidates: Iterable[SuppressionEntry],
+) -> SuppressionEntry | None:
+    for s in candidates:
         if s.file and s.file != finding.file:
             continue
         if s.line is not None and (finding.line or 0) != s.line:
             continue
         return s
-
     return None
 
 
+def match_suppression(
+    finding: Finding,
+    suppressions: list[SuppressionEntry],
+    fingerprint: str | None = None,
+) -> SuppressionEntry | None:
+    fp = fingerprint or finding.fingerprint or finding_fingerprint(finding)
+    by_fp, by_id = _index_suppressions(suppressions)
+    return by_fp.get(fp) or _match_by_location(finding, by_id.get(finding.id, ()))
+
+
 def apply_baseline(
     findings: list[Finding],
     baseline: Baseline | None,
@@ -140,13 +177,14 @@ def apply_baseline(
         return findings, 0, 0
 
     now = today or date.today()
+    by_fp, by_id = baseline._index
     suppressed_total = 0
     expired_total = 0
 
     updated: list[Finding] = []
     for finding in findings:
         fp = finding.fingerprint or finding_fingerprint(finding)
-        match = match_suppression(finding, baseline.suppressions)
+        match = by_fp.get(fp) or _match_by_location(finding, by_id.get(finding.id, ()))
 
         if not match:
             updated.append(
@@ -207,4 +245,4 @@ def generate_baseline(findings: list[Finding]) -> dict[str, Any]:
 
 def write_baseline(path: Path, findings: list[Finding]) -> None:
     payload = generate_baseline(findings)
-    path.write_text(yaml.safe_dump(payload, sort_keys=False))
+    path.write_text(yaml.dump(payload, Dumper=SafeDumper, sort_keys=False))
@@ -59,10 +59,8 @@ def scan(
             raise typer.Exit(code=2)
         files_in_diff_scope = len(include_files)
 
-    findings = run_all_detectors(root, exclude_patterns=cfg.exclude_paths, include_files=include_files)
-
-    ai_settings = load_ai_settings(ai_mode_override=ai_mode)
-    findings, ai_meta = apply_ai_triage(root, findings, ai_settings)
+    files = list(discover_files(root, cfg.exclude_paths, include_files=include_files))
+    findings = run_all_detectors(root, exclude_patterns=cfg.exclude_paths, files=files)
 
     baseline_path: Path | None = None
     if baseline:
@@ -80,13 +78,15 @@ def scan(
 
     findings, suppressed_total, expired_total = apply_baseline(findings, baseline_data)
 
-    files_scanned = len(list(discover_files(root, cfg.exclude_paths, include_files=include_files)))
+    # Triage after the baseline so suppressed findings are never sent to the model.
+    ai_settings = load_ai_settings(ai_mode_override=ai_mode)
+    findings, ai_meta = apply_ai_triage(root, findings, ai_settings)
 
     report = ScanReport(
         scanned_path=str(root),
         findings=findings,
         ai=ai_meta,
-        files_scanned=files_scanned,
+        files_scanned=len(files),
         files_in_diff_scope=files_in_diff_scope,
         suppressed_total=suppressed_total,
         expired_suppressions_total=expired_total,
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+import fnmatch
 import os
+import re
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 DEFAULT_POLICY = {
     "fail_on": {
@@ -23,6 +31,38 @@ DEFAULT_POLICY = {
 }
 
 
+@lru_cache(maxsize=32)
+def compile_exclude_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fold exclude globs into one alternation regex (None when there is nothing to exclude)."""
+    parts = [fnmatch.translate(p.strip()) for p in patterns if p.strip()]
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in parts))
+
+
+@lru_cache(maxsize=32)
+def compile_prune_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Regex of directories whose entire contents an exclude glob covers.
+
+    Only globs ending in ``/*``/``/**`` (or a bare ``*``/``**``) qualify: if
+    the part before the trailing slash matches a directory, the glob matches
+    every path below it, so the walk can skip that directory outright.
+    """
+    parts = []
+    for p in patterns:
+        p = p.strip()
+        head = p.rstrip("*")
+        if head == p:
+            continue
+        if head == "":
+            parts.append(".*")
+        elif head.endswith("/") and len(head) > 1:
+            parts.append(fnmatch.translate(head[:-1]))
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in parts))
+
+
 @dataclass
 class PolicyConfig:
     fail_on: dict[str, int]
@@ -38,6 +78,8 @@ class AiSettings:
     model: str | None
     timeout_seconds: int
     max_findings: int
+    batch_size: int = 20
+    concurrency: int = 4
 
 
 def load_env_file(path: Path) -> None:
@@ -46,14 +88,11 @@ def load_env_file(path: Path) -> None:
         return
 
     for raw in path.read_text(errors="ignore").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
+        key, sep, value = raw.partition("=")
         key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key and key not in os.environ:
-            os.environ[key] = value
+        if not sep or not key or key.startswith("#") or key in os.environ:
+            continue
+        os.environ[key] = value.strip().strip('"').strip("'")
 
 
 def load_policy(path: str | None) -> PolicyConfig:
@@ -67,7 +106,14 @@ def load_policy(path: str | None) -> PolicyConfig:
     if not policy_path.exists():
         raise FileNotFoundError(f"Policy file not found: {path}")
 
-    data = yaml.safe_load(policy_path.read_text()) or {}
+    # Cached by mtime; hand out copies since PolicyConfig is mutable.
+    cached = _load_policy_cached(str(policy_path.resolve()), policy_path.stat().st_mtime_ns)
+    return PolicyConfig(fail_on=dict(cached.fail_on), exclude_paths=list(cached.exclude_paths))
+
+
+@lru_cache(maxsize=8)
+def _load_policy_cached(path: str, mtime_ns: int) -> PolicyConfig:
+    data = yaml.load(Path(path).read_bytes(), Loader=SafeLoader) or {}
     fail_on = DEFAULT_POLICY["fail_on"].copy()
     fail_on.update((data.get("fail_on") or {}))
 
@@ -98,4 +144,6 @@ def load_ai_settings(ai_mode_override: str = "auto") -> AiSettings:
         model=os.getenv("OPENAI_MODEL"),
         timeout_seconds=int(os.getenv("GUARDRAIL_AI_TIMEOUT_SECONDS", "25") or "25"),
         max_findings=int(os.getenv("GUARDRAIL_AI_MAX_FINDINGS", "40") or "40"),
+        batch_size=int(os.getenv("GUARDRAIL_AI_BATCH_SIZE", "20") or "20"),
+        concurrency=int(os.getenv("GUARDRAIL_AI_CONCURRENCY", "4") or "4"),
     )
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
-import fnmatch
+import locale
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
+try:
+    import re2 as _candidate_re  # google-re2: linear-time DFA for the bulk candidate scan
+except ImportError:
+    _candidate_re = re
+
+from guardrail_ci.config import compile_exclude_patterns, compile_prune_patterns
+from guardrail_ci.git_scope import GitScopeError, get_changed_files
 from guardrail_ci.models import Finding, sort_findings
 
 
-TEXT_EXTENSIONS = {
+TEXT_EXTENSIONS = frozenset({
     ".py", ".js", ".ts", ".tsx", ".jsx", ".json", ".yml", ".yaml", ".tf", ".tfvars", ".env", ".txt", ".md", ".toml",
-}
+})
+
+# Encoding Path.read_text() would use; content is decoded the same way.
+_TEXT_ENCODING = locale.getpreferredencoding(False)
+
+# Line boundaries str.splitlines() honours besides \n and \r; lines (and so
+# evidence and fingerprints) must split exactly where it would.
+_OTHER_LINE_BREAK = re.compile("[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+_TO_NEWLINE = str.maketrans(dict.fromkeys("\v\f\x1c\x1d\x1e\x85\u2028\u2029", "\n"))
+
+SPECIAL_FILENAMES = frozenset({"Dockerfile", "requirements.txt", "package-lock.json", "poetry.lock"})
+
+# Files with a NUL byte this early are treated as binary and not scanned.
+BINARY_SNIFF_BYTES = 4096
+
+# Minimum files per worker before run_all_detectors fans out to a process pool.
+PARALLEL_MIN_FILES = 64
 
 SECRET_PATTERNS: list[tuple[str, re.Pattern[str], str]] = [
     (
@@ -25,24 +52,105 @@ SECRET_PATTERNS: list[tuple[str, re.Pattern[str], str]] = [
     ),
     (
         "GR-SEC-003",
-        re.compile(r"(?i)(api[_-]?key|token|secret)\s*[:=]\s*['\"][A-Za-z0-9_\-]{16,}['\"]"),
+        re.compile(r"(?i:(?:api[_-]?key|token|secret)\s*[:=]\s*['\"][A-Za-z0-9_\-]{16,}['\"])"),
         "Store tokens/secrets in environment variables and secret managers.",
     ),
 ]
 
+# Every secret rule folded into one alternation so each file is scanned in a
+# single pass; only lines it hits are re-checked rule by rule.
+_ANY_SECRET_SOURCE = "|".join(f"(?:{pattern.pattern})" for _, pattern, _ in SECRET_PATTERNS)
+_ANY_SECRET_RE = re.compile(_ANY_SECRET_SOURCE)
+
+# The bulk scan must hit every line the per-rule re check would. RE2's \s
+# lacks \v and \x1c-\x1f, so the ASCII whitespace class is spelled out. RE2
+# also differs from re on Unicode whitespace and case folding ("ı" matches
+# "i" only in re), so non-ASCII text is always scanned with _ANY_SECRET_RE.
+_ANY_SECRET = _candidate_re.compile(_ANY_SECRET_SOURCE.replace(r"\s", r"[\t\n\v\f\r\x1c-\x1f ]"))
+
+# Literals at least one secret rule needs; files containing none skip the regex.
+_SECRET_LITERALS = (b"AKIA", b"-----BEGIN")
+_SECRET_KEYWORDS = (b"api", b"token", b"secret")
+
+
+def _secret_candidate_lines(text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of each line the combined secret regex hits, once."""
+    regex = _ANY_SECRET if text.isascii() else _ANY_SECRET_RE
+    pos = 0
+    next_line = 0
+    while True:
+        # finditer keeps the whole scan in one regex call; it is only
+        # restarted when a match runs across a newline, since that match may
+        # have swallowed text a rule would hit on the following line.
+        for m in regex.finditer(text, pos):
+            if m.start() >= next_line:
+                start = text.rfind("\n", 0, m.start()) + 1
+                end = text.find("\n", m.start())
+                if end == -1:
+                    end = len(text)
+                yield start, end
+                next_line = end + 1
+            if m.end() > next_line - 1:
+                pos = next_line
+                break
+        else:
+            return
+
+
+def _may_contain_secret(data: bytes) -> bool:
+    # Checked on raw bytes so files that cannot match are never decoded.
+    if any(literal in data for literal in _SECRET_LITERALS):
+        return True
+    if not data.isascii():
+        # Under (?i) re also matches non-ASCII letters such as "ſ", "ı" and the
+        # Kelvin sign to keyword letters; bytes.lower() cannot see those.
+        return True
+    lowered = data.lower()
+    return any(keyword in lowered for keyword in _SECRET_KEYWORDS)
+
 
 def _is_excluded(path: Path, root: Path, exclude_patterns: list[str] | None) -> bool:
     if not exclude_patterns:
         return False
 
-    rel = path.relative_to(root).as_posix()
-    for pattern in exclude_patterns:
-        p = pattern.strip()
-        if not p:
+    exclude_re = compile_exclude_patterns(tuple(exclude_patterns))
+    if exclude_re is None:
+        return False
+    return exclude_re.match(path.relative_to(root).as_posix()) is not None
+
+
+def _walk_files(root: str, prune: re.Pattern[str] | None = None) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries under ``root``; like rglob, symlinked dirs are not descended.
+
+    Directories whose root-relative posix path matches ``prune`` are skipped
+    without being listed.
+    """
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if prune is not None and prune.match(entry.path[prefix_len:].replace(os.sep, "/")):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
             continue
-        if fnmatch.fnmatch(rel, p):
-            return True
-    return False
+
+
+def _suffix(name: str) -> str:
+    # Same rule as PurePath.suffix, without building a Path.
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ""
+
+
+def _is_candidate(name: str) -> bool:
+    return _suffix(name).lower() in TEXT_EXTENSIONS or name in SPECIAL_FILENAMES
 
 
 def discover_files(
@@ -50,47 +158,204 @@ def discover_files(
     exclude_patterns: list[str] | None = None,
     include_files: set[str] | None = None,
 ) -> Iterable[Path]:
-    allow = {p.replace("\\", "/") for p in include_files} if include_files is not None else None
+    exclude_re = compile_exclude_patterns(tuple(exclude_patterns)) if exclude_patterns else None
 
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        rel = path.relative_to(root).as_posix()
-        if allow is not None and rel not in allow:
+    if include_files is not None:
+        # Incremental scans already know their files; stat those instead of walking the tree.
+        for rel in sorted({p.replace("\\", "/") for p in include_files}):
+            if not _is_candidate(rel.rpartition("/")[2]):
+                continue
+            if exclude_re is not None and exclude_re.match(rel):
+                continue
+            path = root / rel
+            if path.is_file():
+                yield path
+        return
+
+    prune_re = compile_prune_patterns(tuple(exclude_patterns)) if exclude_patterns else None
+    root_str = os.fspath(root)
+    prefix_len = len(root_str.rstrip(os.sep)) + 1
+    for entry in _walk_files(root_str, prune=prune_re):
+        if not _is_candidate(entry.name):
             continue
-        if _is_excluded(path, root, exclude_patterns):
+        rel = entry.path[prefix_len:].replace(os.sep, "/")
+        if exclude_re is not None and exclude_re.match(rel):
             continue
-        if path.suffix.lower() in TEXT_EXTENSIONS or path.name in {"Dockerfile", "requirements.txt", "package-lock.json", "poetry.lock"}:
-            yield path
+        yield Path(entry.path)
+
+
+def _relative(root: Path, path: Path) -> str:
+    """Return ``str(path.relative_to(root))``, by slicing when ``path`` is spelled under ``root``."""
+    root_str = os.fspath(root)
+    path_str = os.fspath(path)
+    cut = len(root_str)
+    if path_str.startswith(root_str) and path_str[cut : cut + 1] == os.sep:
+        return path_str[cut + 1 :]
+    return str(path.relative_to(root))
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    """Return the file's bytes, or None if unreadable or binary (a NUL in the sniffed head)."""
+    try:
+        with path.open("rb") as fh:
+            head = fh.read(BINARY_SNIFF_BYTES)
+            if b"\0" in head:
+                return None
+            return head + fh.read()
+    except Exception:
+        return None
+
+
+def _decode(data: bytes) -> str:
+    """Decode like Path.read_text(errors="ignore"), with every str.splitlines() boundary as "\n"."""
+    text = data.decode(_TEXT_ENCODING, errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if _OTHER_LINE_BREAK.search(text):
+        text = text.translate(_TO_NEWLINE)
+    return text
+
+
+def _secret_findings(rel: str, text: str) -> list[Finding]:
+    findings: list[Finding] = []
+    line_no = 1
+    counted_to = 0
+    for start, end in _secret_candidate_lines(text):
+        line_no += text.count("\n", counted_to, start)
+        counted_to = start
+        line = text[start:end]
+        for finding_id, pattern, remediation in SECRET_PATTERNS:
+            if pattern.search(line):
+                findings.append(
+                    Finding(
+                        id=finding_id,
+                        title="Possible hardcoded secret",
+                        category="secrets",
+                        severity="high",
+                        file=rel,
+                        line=line_no,
+                        message="Potential secret material found in source text.",
+                        remediation=remediation,
+                        evidence=line.strip()[:200],
+                    )
+                )
+    return findings
+
+
+def _terraform_findings(rel: str, text: str) -> list[Finding]:
+    findings: list[Finding] = []
+    line_no = 1
+    counted_to = 0
+    hit = text.find("0.0.0.0/0")
+    while hit != -1:
+        start = text.rfind("\n", 0, hit) + 1
+        end = text.find("\n", hit)
+        if end == -1:
+            end = len(text)
+        line_no += text.count("\n", counted_to, start)
+        counted_to = start
+
+        # Look for an admin port from 4 lines above to 5 lines below the hit.
+        window_start = start
+        for _ in range(4):
+            if window_start == 0:
+                break
+            window_start = text.rfind("\n", 0, window_start - 1) + 1
+        window_end = end
+        for _ in range(5):
+            if window_end >= len(text):
+                break
+            window_end = text.find("\n", window_end + 1)
+            if window_end == -1:
+                window_end = len(text)
+        window = text[window_start:window_end]
+
+        if "22" in window or "3389" in window:
+            findings.append(
+                Finding(
+                    id="GR-IAC-001",
+                    title="Sensitive port exposed to the internet",
+                    category="iac",
+                    severity="critical",
+                    file=rel,
+                    line=line_no,
+                    message="Security group allows 0.0.0.0/0 access to sensitive port.",
+                    remediation="Restrict CIDR ranges and limit public ingress for admin ports.",
+                    evidence=text[start:end].strip(),
+                )
+            )
+        hit = text.find("0.0.0.0/0", end)
+    return findings
+
+
+def _yaml_findings(rel: str, text: str) -> list[Finding]:
+    findings: list[Finding] = []
+    line_no = 1
+    counted_to = 0
+    hit = text.find("privileged: true")
+    while hit != -1:
+        start = text.rfind("\n", 0, hit) + 1
+        end = text.find("\n", hit)
+        if end == -1:
+            end = len(text)
+        line_no += text.count("\n", counted_to, start)
+        counted_to = start
+        findings.append(
+            Finding(
+                id="GR-IAC-002",
+                title="Privileged container enabled",
+                category="iac",
+                severity="high",
+                file=rel,
+                line=line_no,
+                message="Container is configured with privileged=true.",
+                remediation="Run containers as non-privileged and drop unnecessary capabilities.",
+                evidence=text[start:end].strip(),
+            )
+        )
+        hit = text.find("privileged: true", end)
+    return findings
+
+
+_IAC_SCANNERS = {
+    ".tf": _terraform_findings,
+    ".yml": _yaml_findings,
+    ".yaml": _yaml_findings,
+}
+
+
+def _scan_file(root: Path, path: Path) -> list[Finding]:
+    """Read ``path`` once and run every content detector that applies to it."""
+    data = _read_bytes(path)
+    if data is None:
+        return []
+    check_secrets = _may_contain_secret(data)
+    iac = _IAC_SCANNERS.get(_suffix(path.name).lower())
+    if not check_secrets and iac is None:
+        return []
+
+    text = _decode(data)
+    rel = _relative(root, path)
+    findings = _secret_findings(rel, text) if check_secrets else []
+    if iac is not None:
+        findings.extend(iac(rel, text))
+    return findings
 
 
 def scan_secrets(
     root: Path,
     exclude_patterns: list[str] | None = None,
     include_files: set[str] | None = None,
+    files: Iterable[Path] | None = None,
 ) -> list[Finding]:
+    if files is None:
+        files = discover_files(root, exclude_patterns, include_files=include_files)
+
     findings: list[Finding] = []
-    for path in discover_files(root, exclude_patterns, include_files=include_files):
-        try:
-            lines = path.read_text(errors="ignore").splitlines()
-        except Exception:
-            continue
-        for idx, line in enumerate(lines, start=1):
-            for finding_id, pattern, remediation in SECRET_PATTERNS:
-                if pattern.search(line):
-                    findings.append(
-                        Finding(
-                            id=finding_id,
-                            title="Possible hardcoded secret",
-                            category="secrets",
-                            severity="high",
-                            file=str(path.relative_to(root)),
-                            line=idx,
-                            message="Potential secret material found in source text.",
-                            remediation=remediation,
-                            evidence=line.strip()[:200],
-                        )
-                    )
+    for path in files:
+        data = _read_bytes(path)
+        if data is not None and _may_contain_secret(data):
+            findings.extend(_secret_findings(_relative(root, path), _decode(data)))
     return findings
 
 
@@ -98,46 +363,19 @@ def scan_iac(
     root: Path,
     exclude_patterns: list[str] | None = None,
     include_files: set[str] | None = None,
+    files: Iterable[Path] | None = None,
 ) -> list[Finding]:
-    findings: list[Finding] = []
-    for path in discover_files(root, exclude_patterns, include_files=include_files):
-        suffix = path.suffix.lower()
-
-        if suffix == ".tf":
-            lines = path.read_text(errors="ignore").splitlines()
-            for idx, line in enumerate(lines, start=1):
-                if "0.0.0.0/0" in line and any(port in "\n".join(lines[max(0, idx - 5): idx + 5]) for port in ["22", "3389"]):
-                    findings.append(
-                        Finding(
-                            id="GR-IAC-001",
-                            title="Sensitive port exposed to the internet",
-                            category="iac",
-                            severity="critical",
-                            file=str(path.relative_to(root)),
-                            line=idx,
-                            message="Security group allows 0.0.0.0/0 access to sensitive port.",
-                            remediation="Restrict CIDR ranges and limit public ingress for admin ports.",
-                            evidence=line.strip(),
-                        )
-                    )
+    if files is None:
+        files = discover_files(root, exclude_patterns, include_files=include_files)
 
-        if suffix in {".yml", ".yaml"}:
-            lines = path.read_text(errors="ignore").splitlines()
-            for idx, line in enumerate(lines, start=1):
-                if "privileged: true" in line:
-                    findings.append(
-                        Finding(
-                            id="GR-IAC-002",
-                            title="Privileged container enabled",
-                            category="iac",
-                            severity="high",
-                            file=str(path.relative_to(root)),
-                            line=idx,
-                            message="Container is configured with privileged=true.",
-                            remediation="Run containers as non-privileged and drop unnecessary capabilities.",
-                            evidence=line.strip(),
-                        )
-                    )
+    findings: list[Finding] = []
+    for path in files:
+        iac = _IAC_SCANNERS.get(_suffix(path.name).lower())
+        if iac is None:
+            continue
+        data = _read_bytes(path)
+        if data is not None:
+            findings.extend(iac(_relative(root, path), _decode(data)))
     return findings
 
 
@@ -183,13 +421,55 @@ def scan_dependencies(root: Path, exclude_patterns: list[str] | None = None) ->
     return findings
 
 
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
 def run_all_detectors(
     root: Path,
     exclude_patterns: list[str] | None = None,
     include_files: set[str] | None = None,
+    files: list[Path] | None = None,
 ) -> list[Finding]:
-    findings: list[Finding] = []
-    findings.extend(scan_secrets(root, exclude_patterns=exclude_patterns, include_files=include_files))
-    findings.extend(scan_iac(root, exclude_patterns=exclude_patterns, include_files=include_files))
+    """Run every detector; pass ``files`` from discover_files to reuse an existing walk."""
+    if files is None:
+        files = list(discover_files(root, exclude_patterns, include_files=include_files))
+
+    # The re engine holds the GIL while matching, so real parallelism needs
+    # processes. Pool start-up is only worth it for large file sets.
+    scan = partial(_scan_file, root)
+    workers = min(len(files) // PARALLEL_MIN_FILES, _available_cpus())
+    findings: list[Finding] | None = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                findings = [f for file_findings in pool.map(scan, files, chunksize=32) for f in file_findings]
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable multiprocessing here (no sem_open, no /dev/shm, killed worker).
+            findings = None
+    if findings is None:
+        findings = []
+        for path in files:
+            findings.extend(scan(path))
+
     findings.extend(scan_dependencies(root, exclude_patterns=exclude_patterns))
     return sort_findings(findings)
+
+
+def run_changed_detectors(
+    root: Path,
+    base_ref: str,
+    exclude_patterns: list[str] | None = None,
+) -> list[Finding]:
+    """Run every detector on files changed since ``base_ref``...HEAD.
+
+    Falls back to a full scan when the changed set cannot be resolved.
+    """
+    try:
+        changed = get_changed_files(root, base_ref)
+    except GitScopeError:
+        return run_all_detectors(root, exclude_patterns)
+    return run_all_detectors(root, exclude_patterns, include_files=changed)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+import os
 import subprocess
 
 
@@ -13,6 +14,7 @@ def get_changed_files(root: Path, diff_base: str) -> set[str]:
         "git",
         "diff",
         "--name-only",
+        "-z",
         "--diff-filter=ACMR",
         f"{diff_base}...HEAD",
     ]
@@ -22,21 +24,16 @@ def get_changed_files(root: Path, diff_base: str) -> set[str]:
             cmd,
             cwd=str(root),
             capture_output=True,
-            text=True,
             check=False,
         )
     except FileNotFoundError as exc:
         raise GitScopeError("git is not installed or not available in PATH") from exc
 
     if proc.returncode != 0:
-        stderr = (proc.stderr or "").strip()
+        stderr = (proc.stderr or b"").decode(errors="replace").strip()
         raise GitScopeError(
             f"Failed to resolve changed files from diff base '{diff_base}'. {stderr or 'Check git history and ref availability.'}"
         )
 
-    out = set()
-    for line in (proc.stdout or "").splitlines():
-        p = line.strip()
-        if p:
-            out.add(p)
-    return out
+    # -z: NUL-separated, unquoted paths; decoded like any other filesystem name.
+    return {os.fsdecode(p) for p in (proc.stdout or b"").split(b"\0") if p}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, replace
+from collections import Counter
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -9,7 +10,7 @@ from typing import Any
 SEVERITY_ORDER = {"critical": 4, "high": 3, "medium": 2, "low": 1, "info": 0}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     id: str
     title: str
@@ -27,10 +28,17 @@ class Finding:
     suppression_status: str = "none"
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Every field is a primitive, so skip asdict()'s recursive deep copy.
+        return {name: getattr(self, name) for name in _FINDING_FIELDS}
 
     def with_updates(self, **kwargs: Any) -> "Finding":
-        return replace(self, **kwargs)
+        # Cheaper than dataclasses.replace(): no per-call field introspection.
+        values = {name: getattr(self, name) for name in _FINDING_FIELDS}
+        values.update(kwargs)
+        return Finding(**values)
+
+
+_FINDING_FIELDS = tuple(f.name for f in fields(Finding))
 
 
 @dataclass(frozen=True)
@@ -48,8 +56,7 @@ class ScanReport:
         pool = self.findings
         if not include_suppressed:
             pool = [f for f in self.findings if not f.suppressed]
-        for finding in pool:
-            counts[finding.severity] = counts.get(finding.severity, 0) + 1
+        counts.update(Counter(f.severity for f in pool))
         counts["total"] = len(pool)
         return counts
 
@@ -74,10 +81,11 @@ class ScanReport:
 
 
 def sort_findings(findings: list[Finding]) -> list[Finding]:
+    rank = SEVERITY_ORDER.get
     return sorted(
         findings,
         key=lambda f: (
-            -SEVERITY_ORDER.get(f.severity, 0),
+            -rank(f.severity, 0),
             f.category,
             f.file,
             f.line or 0,
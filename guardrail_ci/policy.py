@@ -1,21 +1,34 @@
 from __future__ import annotations
 
 from guardrail_ci.config import PolicyConfig
-from guardrail_ci.models import ScanReport
+from guardrail_ci.models import SEVERITY_ORDER, ScanReport
 
 
 def evaluate_policy(
     report: ScanReport,
     config: PolicyConfig,
     baseline_strict_expiry: bool = False,
+    *,
+    fail_fast: bool = False,
 ) -> tuple[bool, list[str]]:
+    """Check the effective findings against the policy thresholds.
+
+    With ``fail_fast`` thresholds are checked from the most severe down and
+    only the first violation is reported.
+    """
     summary = report.effective_summary()
     reasons: list[str] = []
 
-    for sev, threshold in config.fail_on.items():
+    thresholds = config.fail_on.items()
+    if fail_fast:
+        thresholds = sorted(thresholds, key=lambda item: -SEVERITY_ORDER.get(item[0], -1))
+
+    for sev, threshold in thresholds:
         actual = summary.get(sev, 0)
         if actual >= threshold:
             reasons.append(f"{sev} findings: {actual} (threshold: {threshold})")
+            if fail_fast:
+                return (False, reasons)
 
     if baseline_strict_expiry and report.expired_suppressions_total > 0:
         reasons.append(
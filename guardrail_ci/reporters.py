@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
 from guardrail_ci import __version__
-from guardrail_ci.models import ScanReport
+from guardrail_ci.models import Finding, ScanReport
 
 
 SARIF_LEVEL_MAP = {
@@ -17,112 +23,124 @@ SARIF_LEVEL_MAP = {
 }
 
 
+def _write_json(payload: dict[str, Any], path: Path) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    # Stream into the file rather than building the whole document as one string.
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2)
+
+
 def write_json_report(report: ScanReport, path: Path) -> None:
-    path.write_text(json.dumps(report.to_dict(), indent=2))
+    _write_json(report.to_dict(), path)
 
 
 def build_markdown_report(report: ScanReport, policy_passed: bool, reasons: list[str]) -> str:
     s = report.summary()
     eff = report.effective_summary()
-    lines = [
-        "# guardrail-ci scan report",
-        "",
-        f"- **Scanned Path:** `{report.scanned_path}`",
-        f"- **Policy Result:** {'PASS ✅' if policy_passed else 'FAIL ❌'}",
-        f"- **Files Scanned:** {report.files_scanned}",
-        f"- **Files in Diff Scope:** {report.files_in_diff_scope if report.files_in_diff_scope is not None else 'n/a'}",
-        f"- **Total Findings:** {s['total']}",
-        f"- **Effective Findings (unsuppressed):** {eff['total']}",
-        f"- **Suppressed/Expired Suppressions:** {report.suppressed_total}/{report.expired_suppressions_total}",
-        f"- **Critical/High/Medium/Low:** {s['critical']}/{s['high']}/{s['medium']}/{s['low']}",
-        f"- **Effective Critical/High/Medium/Low:** {eff['critical']}/{eff['high']}/{eff['medium']}/{eff['low']}",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "# guardrail-ci scan report\n"
+        "\n"
+        f"- **Scanned Path:** `{report.scanned_path}`\n"
+        f"- **Policy Result:** {'PASS ✅' if policy_passed else 'FAIL ❌'}\n"
+        f"- **Files Scanned:** {report.files_scanned}\n"
+        f"- **Files in Diff Scope:** {report.files_in_diff_scope if report.files_in_diff_scope is not None else 'n/a'}\n"
+        f"- **Total Findings:** {s['total']}\n"
+        f"- **Effective Findings (unsuppressed):** {eff['total']}\n"
+        f"- **Suppressed/Expired Suppressions:** {report.suppressed_total}/{report.expired_suppressions_total}\n"
+        f"- **Critical/High/Medium/Low:** {s['critical']}/{s['high']}/{s['medium']}/{s['low']}\n"
+        f"- **Effective Critical/High/Medium/Low:** {eff['critical']}/{eff['high']}/{eff['medium']}/{eff['low']}\n"
+        "\n"
+    )
 
     if report.ai:
-        lines.extend(["## AI triage", ""])
+        w("## AI triage\n\n")
         for k, v in report.ai.items():
-            lines.append(f"- **{k}**: `{v}`")
-        lines.append("")
+            w(f"- **{k}**: `{v}`\n")
+        w("\n")
 
     if reasons:
-        lines.extend(["## Policy failure reasons", ""])
-        lines.extend([f"- {r}" for r in reasons])
-        lines.append("")
+        w("## Policy failure reasons\n\n")
+        for r in reasons:
+            w(f"- {r}\n")
+        w("\n")
 
-    lines.extend(["## Findings", ""])
+    w("## Findings\n\n")
     if not report.findings:
-        lines.append("No findings. 🎉")
-    else:
-        for finding in report.findings:
-            sup = ""
-            if finding.suppression_status != "none":
-                sup = (
-                    f"\n- Suppression: **{finding.suppression_status.upper()}**"
-                    f" ({finding.suppression_reason or 'n/a'}, expires {finding.suppression_expires_at or 'n/a'})"
-                )
-            lines.extend(
-                [
-                    f"### [{finding.id}] {finding.title}",
-                    f"- Severity: **{finding.severity.upper()}**",
-                    f"- Category: `{finding.category}`",
-                    f"- Location: `{finding.file}`{':' + str(finding.line) if finding.line else ''}",
-                    f"- Why it matters: {finding.message}",
-                    f"- Remediation: {finding.remediation}",
-                    f"- Evidence: `{finding.evidence}`{sup}",
-                    "",
-                ]
+        return buf.getvalue() + "No findings. 🎉"
+
+    for i, finding in enumerate(report.findings):
+        if i:
+            w("\n")
+        sup = ""
+        if finding.suppression_status != "none":
+            sup = (
+                f"\n- Suppression: **{finding.suppression_status.upper()}**"
+                f" ({finding.suppression_reason or 'n/a'}, expires {finding.suppression_expires_at or 'n/a'})"
             )
-
-    return "\n".join(lines)
+        w(
+            f"### [{finding.id}] {finding.title}\n"
+            f"- Severity: **{finding.severity.upper()}**\n"
+            f"- Category: `{finding.category}`\n"
+            f"- Location: `{finding.file}`{':' + str(finding.line) if finding.line else ''}\n"
+            f"- Why it matters: {finding.message}\n"
+            f"- Remediation: {finding.remediation}\n"
+            f"- Evidence: `{finding.evidence}`{sup}\n"
+        )
+    return buf.getvalue()
 
 
 def write_markdown_report(report: ScanReport, path: Path, policy_passed: bool, reasons: list[str]) -> None:
     path.write_text(build_markdown_report(report, policy_passed, reasons))
 
 
-def _sarif_rule_map(report: ScanReport) -> list[dict[str, Any]]:
-    rules: dict[str, dict[str, Any]] = {}
-    for f in report.findings:
-        if f.id in rules:
-            continue
-        rules[f.id] = {
-            "id": f.id,
-            "name": f.title,
-            "shortDescription": {"text": f.title},
-            "fullDescription": {"text": f.message},
-            "help": {"text": f.remediation},
-            "properties": {"category": f.category},
-        }
-    return list(rules.values())
+def _sarif_rule(f: Finding) -> dict[str, Any]:
+    return {
+        "id": f.id,
+        "name": f.title,
+        "shortDescription": {"text": f.title},
+        "fullDescription": {"text": f.message},
+        "help": {"text": f.remediation},
+        "properties": {"category": f.category},
+    }
 
 
 def build_sarif_report(report: ScanReport) -> dict[str, Any]:
+    # Rules and results come out of one pass; a rule is described by the first finding with its id.
+    rules: dict[str, dict[str, Any]] = {}
     results = []
+    level = SARIF_LEVEL_MAP.get
     for f in report.findings:
-        result: dict[str, Any] = {
-            "ruleId": f.id,
-            "level": SARIF_LEVEL_MAP.get(f.severity, "warning"),
-            "message": {"text": f.message},
-            "properties": {
-                "severity": f.severity,
-                "category": f.category,
-                "suppressed": f.suppressed,
-                "suppression_status": f.suppression_status,
-                "suppression_reason": f.suppression_reason,
-                "suppression_expires_at": f.suppression_expires_at,
-                "fingerprint": f.fingerprint,
-            },
-            "locations": [
-                {
-                    "physicalLocation": {
-                        "artifactLocation": {"uri": f.file},
-                        "region": {"startLine": f.line or 1},
+        if f.id not in rules:
+            rules[f.id] = _sarif_rule(f)
+        results.append(
+            {
+                "ruleId": f.id,
+                "level": level(f.severity, "warning"),
+                "message": {"text": f.message},
+                "properties": {
+                    "severity": f.severity,
+                    "category": f.category,
+                    "suppressed": f.suppressed,
+                    "suppression_status": f.suppression_status,
+                    "suppression_reason": f.suppression_reason,
+                    "suppression_expires_at": f.suppression_expires_at,
+                    "fingerprint": f.fingerprint,
+                },
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            # SARIF URIs use forward slashes; finding paths use the OS separator.
+                            "artifactLocation": {"uri": f.file.replace("\\", "/")},
+                            "region": {"startLine": f.line or 1},
+                        }
                     }
-                }
-            ],
-        }
-        results.append(result)
+                ],
+            }
+        )
 
     return {
         "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
@@ -133,7 +151,7 @@ def build_sarif_report(report: ScanReport) -> dict[str, Any]:
                     "driver": {
                         "name": "guardrail-ci",
                         "version": __version__,
-                        "rules": _sarif_rule_map(report),
+                        "rules": list(rules.values()),
                     }
                 },
                 "results": results,
@@ -143,4 +161,4 @@ def build_sarif_report(report: ScanReport) -> dict[str, Any]:
 
 
 def write_sarif_report(report: ScanReport, path: Path) -> None:
-    path.write_text(json.dumps(build_sarif_report(report), indent=2))
+    _write_json(build_sarif_report(report), path)
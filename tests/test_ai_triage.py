@@ -1,6 +1,13 @@
 from pathlib import Path
+from unittest.mock import patch
 
-from guardrail_ci.ai_triage import apply_ai_triage
+from guardrail_ci.ai_triage import (
+    _build_payload,
+    _extract_json,
+    _get_session,
+    _read_head,
+    apply_ai_triage,
+)
 from guardrail_ci.config import AiSettings
 from guardrail_ci.models import Finding
 
@@ -35,3 +42,169 @@ def test_ai_triage_falls_back_when_config_missing():
     assert out == findings
     assert meta["status"] == "fallback"
     assert meta["reason"] == "missing_openai_config"
+
+
+def _settings() -> AiSettings:
+    return AiSettings(
+        mode="on",
+        enabled=True,
+        base_url="https://llm.example.com/v1",
+        api_key="k",
+        model="m",
+        timeout_seconds=5,
+        max_findings=10,
+    )
+
+
+class _Resp:
+    def __init__(self, content: str):
+        self._content = content
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return {"choices": [{"message": {"content": self._content}}]}
+
+
+def test_ai_triage_posts_through_shared_session():
+    content = '{"decisions": [{"id": "GR-SEC-001", "file": "main.py", "line": 1, "severity": "low", "rationale": "test key"}]}'
+    with patch("guardrail_ci.ai_triage._get_session") as mock_session:
+        mock_post = mock_session.return_value.post
+        mock_post.return_value = _Resp(content)
+        out, meta = apply_ai_triage(Path("."), [_sample_finding()], _settings())
+
+    assert mock_post.call_count == 1
+    assert mock_post.call_args.args[0] == "https://llm.example.com/v1/chat/completions"
+    assert isinstance(mock_post.call_args.kwargs["data"], bytes)
+    assert meta["status"] == "ok"
+    assert meta["decisions_applied"] == 1
+    assert out[0].severity == "low"
+
+
+def test_ai_triage_splits_findings_into_batches():
+    findings = [_sample_finding().with_updates(line=i) for i in range(1, 6)]
+    settings = _settings()
+    settings.batch_size = 2
+    with patch("guardrail_ci.ai_triage._get_session") as mock_session:
+        mock_post = mock_session.return_value.post
+        mock_post.return_value = _Resp('{"decisions": []}')
+        out, meta = apply_ai_triage(Path("."), findings, settings)
+
+    assert mock_post.call_count == 3
+    assert meta["status"] == "ok"
+    assert meta["batches"] == 3
+    assert meta["requested_findings"] == 5
+    assert out == findings
+
+
+def test_ai_triage_reports_partial_batch_failures():
+    findings = [_sample_finding().with_updates(line=i) for i in range(1, 4)]
+    settings = _settings()
+    settings.batch_size = 1
+    with patch("guardrail_ci.ai_triage._get_session") as mock_session:
+        mock_post = mock_session.return_value.post
+        mock_post.side_effect = [_Resp('{"decisions": []}'), RuntimeError("boom"), _Resp("not json")]
+        out, meta = apply_ai_triage(Path("."), findings, settings)
+
+    assert meta["status"] == "ok"
+    assert meta["batches_failed"] == 2
+    assert meta["batches_invalid_shape"] == 1
+    assert meta["error"] == "boom"
+    assert out == findings
+
+
+def test_build_payload_context_is_numbered_window(tmp_path: Path):
+    (tmp_path / "main.py").write_text("\n".join(f"line{i}" for i in range(1, 11)) + "\n")
+    findings = [_sample_finding().with_updates(line=5), _sample_finding().with_updates(line=1)]
+
+    payload = _build_payload(tmp_path, findings, max_findings=10)
+
+    assert payload[0]["context"] == "3: line3\n4: line4\n5: line5\n6: line6\n7: line7"
+    assert payload[1]["context"] == "1: line1\n2: line2\n3: line3"
+
+
+def test_build_payload_reads_shared_file_once(tmp_path: Path):
+    (tmp_path / "main.py").write_text("\n".join(f"line{i}" for i in range(1, 21)) + "\n")
+    findings = [_sample_finding().with_updates(line=2), _sample_finding().with_updates(line=15)]
+
+    with patch("guardrail_ci.ai_triage._read_head", wraps=_read_head) as mock_read:
+        payload = _build_payload(tmp_path, findings, max_findings=10)
+
+    assert mock_read.call_count == 1
+    assert payload[0]["context"].startswith("1: line1")
+    assert payload[1]["context"].endswith("17: line17")
+
+
+def test_build_payload_numbers_lines_like_the_detectors(tmp_path: Path):
+    (tmp_path / "main.py").write_text('a = 1\n\x0c\nb = 2\ntoken = "abcdefghijklmnopqrstuv"\nc = 3\n')
+    findings = [_sample_finding().with_updates(line=5)]
+
+    payload = _build_payload(tmp_path, findings, max_findings=10)
+
+    assert payload[0]["context"] == '3: \n4: b = 2\n5: token = "abcdefghijklmnopqrstuv"\n6: c = 3'
+
+
+def test_extract_json_handles_bare_fenced_and_embedded_objects():
+    assert _extract_json('{"decisions": []}') == {"decisions": []}
+    assert _extract_json('```json\n{"decisions": [1]}\n```') == {"decisions": [1]}
+    assert _extract_json('Sure: {"decisions": [2]} done') == {"decisions": [2]}
+    assert _extract_json("no json here") == {}
+
+
+def test_extract_json_brace_scan_ignores_braces_in_strings():
+    text = 'Result: {"decisions": [{"rationale": "uses } and \\" {"}]} trailing {junk}'
+    assert _extract_json(text) == {"decisions": [{"rationale": 'uses } and " {'}]}
+    assert _extract_json("{unterminated") == {}
+
+
+def test_extract_json_without_orjson():
+    with patch("guardrail_ci.ai_triage.orjson", None):
+        assert _extract_json('{"decisions": []}') == {"decisions": []}
+        assert _extract_json('noise {"decisions": [3]}') == {"decisions": [3]}
+
+
+def test_ai_triage_skips_suppressed_findings_and_keeps_metadata():
+    suppressed = _sample_finding().with_updates(line=2, suppressed=True, suppression_status="active", fingerprint="s")
+    open_finding = _sample_finding().with_updates(fingerprint="o", suppression_status="none")
+    content = '{"decisions": [{"id": "GR-SEC-001", "file": "main.py", "line": 1, "severity": "low"}]}'
+    with patch("guardrail_ci.ai_triage._get_session") as mock_session:
+        mock_post = mock_session.return_value.post
+        mock_post.return_value = _Resp(content)
+        out, meta = apply_ai_triage(Path("."), [suppressed, open_finding], _settings())
+
+    assert meta["requested_findings"] == 1
+    by_line = {f.line: f for f in out}
+    assert by_line[1].severity == "low"
+    assert by_line[1].fingerprint == "o"
+    assert by_line[2] == suppressed
+
+
+def test_ai_triage_skips_when_everything_is_suppressed():
+    suppressed = _sample_finding().with_updates(suppressed=True, suppression_status="active")
+    out, meta = apply_ai_triage(Path("."), [suppressed], _settings())
+    assert out == [suppressed]
+    assert meta["reason"] == "all_suppressed"
+
+
+def test_ai_triage_skips_when_max_findings_selects_nothing():
+    settings = _settings()
+    settings.max_findings = 0
+    with patch("guardrail_ci.ai_triage._get_session") as mock_session:
+        out, meta = apply_ai_triage(Path("."), [_sample_finding()], settings)
+
+    assert mock_session.return_value.post.call_count == 0
+    assert out == [_sample_finding()]
+    assert meta == {"status": "skipped", "mode": "on", "reason": "no_findings_selected"}
+
+
+def test_session_pool_is_sized_for_configured_concurrency():
+    settings = _settings()
+    settings.concurrency = 16
+    with patch("guardrail_ci.ai_triage._get_session") as mock_session:
+        mock_session.return_value.post.return_value = _Resp('{"decisions": []}')
+        apply_ai_triage(Path("."), [_sample_finding()], settings)
+    mock_session.assert_called_once_with(16)
+
+    adapter = _get_session(16).get_adapter("https://llm.example.com")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
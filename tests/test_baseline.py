@@ -3,7 +3,17 @@ from pathlib import Path
 
 import pytest
 
-from guardrail_ci.baseline import apply_baseline, finding_fingerprint, load_baseline
+from guardrail_ci import baseline as baseline_module
+from guardrail_ci.baseline import (
+    Baseline,
+    SuppressionEntry,
+    apply_baseline,
+    finding_fingerprint,
+    load_baseline,
+    match_suppression,
+    normalize_evidence,
+    write_baseline,
+)
 from guardrail_ci.config import PolicyConfig
 from guardrail_ci.models import Finding, ScanReport
 from guardrail_ci.policy import evaluate_policy
@@ -46,6 +56,15 @@ def test_load_baseline_valid(tmp_path: Path):
     assert len(out.suppressions) == 1
 
 
+def test_load_baseline_decodes_utf8_reason(tmp_path: Path):
+    baseline = tmp_path / ".guardrail-baseline.yml"
+    baseline.write_bytes(
+        "suppressions:\n  - id: GR-SEC-003\n    file: app.py\n    reason: geprüft – ok\n    expires_at: '2099-01-01'\n".encode("utf-8")
+    )
+
+    assert load_baseline(baseline).suppressions[0].reason == "geprüft – ok"
+
+
 def test_apply_baseline_marks_suppressed_with_fingerprint(tmp_path: Path):
     finding = _finding()
     baseline = tmp_path / "b.yml"
@@ -125,3 +144,72 @@ def test_invalid_baseline_rejects_missing_reason(tmp_path: Path):
 
     with pytest.raises(ValueError):
         load_baseline(baseline)
+
+
+def test_normalize_evidence_collapses_whitespace():
+    assert normalize_evidence("  Token =\t'ABC'\n ") == "token = 'abc'"
+
+
+def test_apply_baseline_matches_by_location_without_fingerprint():
+    finding = _finding()
+    baseline = Baseline(
+        version=1,
+        suppressions=[
+            SuppressionEntry(id="GR-SEC-003", reason="other file", expires_at=date(2099, 1, 1), file="src/other.py"),
+            SuppressionEntry(id="GR-SEC-003", reason="match", expires_at=date(2099, 1, 1), file="src/config.py", line=42),
+        ],
+    )
+    out, suppressed_total, _ = apply_baseline([finding], baseline, today=date(2026, 2, 17))
+
+    assert suppressed_total == 1
+    assert out[0].suppression_reason == "match"
+
+
+def test_apply_baseline_indexes_a_loaded_baseline_once(tmp_path: Path, monkeypatch):
+    path = tmp_path / ".guardrail-baseline.yml"
+    write_baseline(path, [_finding()])
+    calls = []
+    real_index = baseline_module._index_suppressions
+    monkeypatch.setattr(baseline_module, "_index_suppressions", lambda s: calls.append(s) or real_index(s))
+
+    for _ in range(3):
+        _, suppressed_total, _ = apply_baseline([_finding()], load_baseline(path), today=date(2026, 2, 17))
+        assert suppressed_total == 1
+    assert len(calls) == 1
+
+
+def test_load_baseline_returns_immutable_suppressions(tmp_path: Path):
+    path = tmp_path / ".guardrail-baseline.yml"
+    write_baseline(path, [_finding()])
+
+    first = load_baseline(path)
+    with pytest.raises(AttributeError):
+        first.suppressions.append(first.suppressions[0])
+    assert len(load_baseline(path).suppressions) == 1
+
+
+def test_baseline_index_cannot_go_stale():
+    entries = [SuppressionEntry(id="GR-SEC-003", reason="other", expires_at=date(2099, 1, 1), file="src/other.py")]
+    baseline = Baseline(version=1, suppressions=entries)
+    apply_baseline([_finding()], baseline, today=date(2026, 2, 17))
+
+    entries.append(SuppressionEntry(id="GR-SEC-003", reason="late", expires_at=date(2099, 1, 1), file="src/config.py"))
+    assert isinstance(baseline.suppressions, tuple)
+    assert len(baseline.suppressions) == 1
+    _, suppressed_total, _ = apply_baseline([_finding()], baseline, today=date(2026, 2, 17))
+    assert suppressed_total == 0
+
+
+def test_write_baseline_round_trips(tmp_path: Path):
+    path = tmp_path / ".guardrail-baseline.yml"
+    write_baseline(path, [_finding()])
+
+    out = load_baseline(path)
+    assert out.suppressions[0].fingerprint == finding_fingerprint(_finding())
+    assert out.suppressions[0].expires_at == date(2099, 12, 31)
+
+
+def test_match_suppression_uses_supplied_fingerprint():
+    entry = SuppressionEntry(id="GR-SEC-003", reason="r", expires_at=date(2099, 1, 1), file="other.py", fingerprint="precomputed")
+    assert match_suppression(_finding(), [entry], fingerprint="precomputed") is entry
+    assert match_suppression(_finding(), [entry]) is None
@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+
+from guardrail_ci.config import compile_exclude_patterns, compile_prune_patterns, load_env_file, load_policy
+
+
+def test_load_env_file_parses_quotes_and_skips_comments(tmp_path: Path, monkeypatch):
+    for key in ("GR_T_PLAIN", "GR_T_DOUBLE", "GR_T_SINGLE", "GR_T_HASH", "GR_T_COMMENTED", "GR_T_EMPTY"):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("GR_T_EXISTING", "keep")
+
+    env = tmp_path / ".env"
+    env.write_text(
+        "\n".join(
+            [
+                "# comment",
+                "GR_T_PLAIN = value",
+                'GR_T_DOUBLE="quoted value"',
+                "GR_T_SINGLE='single'",
+                "GR_T_HASH=abc#def",
+                "# GR_T_COMMENTED=nope",
+                "GR_T_EMPTY=",
+                "GR_T_EXISTING=override",
+                "not a pair",
+            ]
+        )
+        + "\r\n"
+    )
+    load_env_file(env)
+
+    assert os.environ["GR_T_PLAIN"] == "value"
+    assert os.environ["GR_T_DOUBLE"] == "quoted value"
+    assert os.environ["GR_T_SINGLE"] == "single"
+    assert os.environ["GR_T_HASH"] == "abc#def"
+    assert os.environ["GR_T_EMPTY"] == ""
+    assert os.environ["GR_T_EXISTING"] == "keep"
+    assert "GR_T_COMMENTED" not in os.environ
+
+
+def test_load_env_file_keeps_lenient_key_and_quote_rules(tmp_path: Path, monkeypatch):
+    for key in ("GR_T.DOTTED", "GR_T_MIXED", "GR_T_OPEN", "GR_T_TRAILING"):
+        monkeypatch.delenv(key, raising=False)
+
+    env = tmp_path / ".env"
+    env.write_text(
+        "\n".join(
+            [
+                "GR_T.DOTTED=1",
+                "GR_T_MIXED=\"abc'",
+                'GR_T_OPEN="x',
+                'GR_T_TRAILING="bar" # c',
+            ]
+        )
+        + "\n"
+    )
+    load_env_file(env)
+
+    assert os.environ["GR_T.DOTTED"] == "1"
+    assert os.environ["GR_T_MIXED"] == "abc"
+    assert os.environ["GR_T_OPEN"] == "x"
+    assert os.environ["GR_T_TRAILING"] == 'bar" # c'
+
+
+def test_compile_exclude_patterns_matches_any_glob():
+    rx = compile_exclude_patterns(("node_modules/**", "*.min.js", " "))
+    assert rx.match("node_modules/pkg/index.js")
+    assert rx.match("app.min.js")
+    assert not rx.match("src/app.js")
+    assert compile_exclude_patterns(()) is None
+
+
+def test_load_policy_reparses_after_file_change(tmp_path: Path):
+    policy = tmp_path / "guardrail.yml"
+    policy.write_text("fail_on:\n  high: 3\n")
+    first = load_policy(str(policy))
+    first.fail_on["high"] = 100
+    assert load_policy(str(policy)).fail_on["high"] == 3
+
+    policy.write_text("fail_on:\n  high: 5\n")
+    stat = policy.stat()
+    os.utime(policy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_policy(str(policy)).fail_on["high"] == 5
+
+
+def test_compile_prune_patterns_only_uses_whole_directory_globs():
+    rx = compile_prune_patterns(("node_modules/**", "**/dist/*", "*.min.js", "docs/*.md"))
+    assert rx.match("node_modules")
+    assert rx.match("web/dist")
+    assert not rx.match("docs")
+    assert not rx.match("src")
+    assert compile_prune_patterns(("**",)).match("anything")
+    assert compile_prune_patterns(("*.py",)) is None
@@ -7,7 +7,7 @@ from guardrail_ci.git_scope import GitScopeError, get_changed_files
 
 
 class _Proc:
-    def __init__(self, returncode=0, stdout="", stderr=""):
+    def __init__(self, returncode=0, stdout=b"", stderr=b""):
         self.returncode = returncode
         self.stdout = stdout
         self.stderr = stderr
@@ -15,14 +15,14 @@ class _Proc:
 
 @patch("guardrail_ci.git_scope.subprocess.run")
 def test_get_changed_files_success(mock_run):
-    mock_run.return_value = _Proc(returncode=0, stdout="a.py\nb/c.tf\n")
+    mock_run.return_value = _Proc(returncode=0, stdout=b"a.py\0b/c.tf\0")
     out = get_changed_files(Path("."), "origin/main")
     assert out == {"a.py", "b/c.tf"}
 
 
 @patch("guardrail_ci.git_scope.subprocess.run")
 def test_get_changed_files_invalid_ref(mock_run):
-    mock_run.return_value = _Proc(returncode=128, stderr="bad revision")
+    mock_run.return_value = _Proc(returncode=128, stderr=b"bad revision")
     with pytest.raises(GitScopeError):
         get_changed_files(Path("."), "origin/does-not-exist")
 
@@ -31,3 +31,14 @@ def test_get_changed_files_git_missing():
     with patch("guardrail_ci.git_scope.subprocess.run", side_effect=FileNotFoundError()):
         with pytest.raises(GitScopeError):
             get_changed_files(Path("."), "origin/main")
+
+
+@patch("guardrail_ci.git_scope.subprocess.run")
+def test_get_changed_files_asks_git_every_time(mock_run):
+    # The answer depends on HEAD, which can move between calls.
+    mock_run.return_value = _Proc(returncode=0, stdout=b"a.py\0")
+    assert get_changed_files(Path("."), "origin/main") == {"a.py"}
+
+    mock_run.return_value = _Proc(returncode=0, stdout=b"a.py\0b.py\0")
+    assert get_changed_files(Path("."), "origin/main") == {"a.py", "b.py"}
+    assert mock_run.call_count == 2
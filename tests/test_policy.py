@@ -31,3 +31,16 @@ def test_policy_passes_when_under_threshold():
     ok, reasons = evaluate_policy(report, cfg)
     assert ok
     assert reasons == []
+
+
+def test_policy_fail_fast_reports_only_most_severe_violation():
+    report = ScanReport(scanned_path=".", findings=[_finding("low"), _finding("critical")])
+    cfg = PolicyConfig(fail_on={"low": 1, "high": 999, "critical": 1})
+
+    ok, reasons = evaluate_policy(report, cfg)
+    assert not ok
+    assert len(reasons) == 2
+
+    ok, reasons = evaluate_policy(report, cfg, fail_fast=True)
+    assert not ok
+    assert reasons == ["critical findings: 1 (threshold: 1)"]
@@ -1,5 +1,15 @@
+import json
+from pathlib import Path
+
+import pytest
+
 from guardrail_ci.models import Finding, ScanReport
-from guardrail_ci.reporters import build_markdown_report, build_sarif_report
+from guardrail_ci.reporters import (
+    build_markdown_report,
+    build_sarif_report,
+    write_json_report,
+    write_sarif_report,
+)
 
 
 def _finding() -> Finding:
@@ -43,3 +53,23 @@ def test_sarif_properties_include_suppression_metadata():
     assert props["suppressed"] is True
     assert props["suppression_status"] == "active"
     assert props["fingerprint"] == "abc"
+
+
+def test_sarif_uri_uses_forward_slashes():
+    finding = _finding().with_updates(file="src\\app.py")
+    sarif = build_sarif_report(ScanReport(scanned_path=".", findings=[finding]))
+    location = sarif["runs"][0]["results"][0]["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"]["uri"] == "src/app.py"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_and_sarif_writers_emit_valid_json(tmp_path: Path, monkeypatch, use_orjson: bool):
+    if not use_orjson:
+        monkeypatch.setattr("guardrail_ci.reporters.orjson", None)
+    report = ScanReport(scanned_path=".", findings=[_finding()])
+
+    write_json_report(report, tmp_path / "r.json")
+    write_sarif_report(report, tmp_path / "r.sarif")
+
+    assert json.loads((tmp_path / "r.json").read_text())["findings"][0]["id"] == "GR-SEC-003"
+    assert json.loads((tmp_path / "r.sarif").read_text())["version"] == "2.1.0"